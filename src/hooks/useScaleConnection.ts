@@ -28,6 +28,10 @@ const DEFAULT_CONFIG: ScaleConfig = {
 
 const STOP_MOVING_MS = 800; // display number unchanged for 0.8s = locked
 
+// Compiled once and reused for every frame in the read loop
+const LINE_SPLIT = /[\r\n]+/;
+const WEIGHT_PATTERN = /([+-]?\d+\.?\d*)/;
+
 // ── Hook ────────────────────────────────────────────────────────────
 export function useScaleConnection() {
   const [scaleState, setScaleState] = useState<ScaleState>('DISCONNECTED');
@@ -51,7 +55,6 @@ export function useScaleConnection() {
 
   // Weight-lock tracking – locks when weight stops moving
   const lastReadingRef = useRef<number | null>(null);
-  const lastChangedTime = useRef<number>(Date.now());
   const stableWeightRef = useRef<WeightData | null>(null);
   const lockTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   useEffect(() => { stableWeightRef.current = stableWeight; }, [stableWeight]);
@@ -67,7 +70,6 @@ export function useScaleConnection() {
 
     if (numberChanged) {
       // Displayed number changed – clear any pending lock, unlock if locked
-      lastChangedTime.current = Date.now();
       if (lockTimerRef.current) {
         clearTimeout(lockTimerRef.current);
         lockTimerRef.current = null;
@@ -124,30 +126,35 @@ export function useScaleConnection() {
         if (!value) continue;
 
         lineBuffer += value;
-        const lines = lineBuffer.split(/[\r\n]+/);
+        const lines = lineBuffer.split(LINE_SPLIT);
         lineBuffer = lines.pop() || '';
 
+        let latestWeight: number | null = null;
+
         for (const line of lines) {
           const trimmed = line.trim();
           if (!trimmed) continue;
 
           console.log('[Scale raw]', JSON.stringify(trimmed));
 
-          const numMatch = trimmed.match(/([+-]?\d+\.?\d*)/);
+          const numMatch = trimmed.match(WEIGHT_PATTERN);
           const weight = numMatch ? parseFloat(numMatch[1]) : NaN;
-          const displayWeight = isNaN(weight) ? 0 : weight;
+          latestWeight = isNaN(weight) ? 0 : weight;
 
+          if (!isNaN(weight)) {
+            handleWeightReading(weight);
+          }
+        }
+
+        // Publish only the last reading of the burst – one state update per chunk
+        if (latestWeight !== null) {
           setCurrentWeight({
-            weight: displayWeight,
+            weight: latestWeight,
             stable: false,
             timestamp: new Date(),
           });
           setScaleState('WEIGHING');
           setLastError(null);
-
-          if (!isNaN(weight)) {
-            handleWeightReading(weight);
-          }
         }
       }
     } catch (e: unknown) {
@@ -174,7 +181,6 @@ export function useScaleConnection() {
     portRef.current = port;
     runningRef.current = true;
     lastReadingRef.current = null;
-    lastChangedTime.current = Date.now();
     setScaleState('CONNECTED');
     setLastError(null);
 
@@ -237,7 +243,6 @@ export function useScaleConnection() {
   const resetForNextSale = useCallback(() => {
     setStableWeight(null);
     lastReadingRef.current = null;
-    lastChangedTime.current = Date.now();
     if (lockTimerRef.current) {
       clearTimeout(lockTimerRef.current);
       lockTimerRef.current = null;